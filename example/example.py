@@ -28,7 +28,7 @@ naca0012.gen_skin()
 surface_domain = PlaneSurface([farfield, naca0012])
 
 # Synchronize and generate BC marker
-gmsh.model.occ.synchronize()
+gmsh.model.geo.synchronize()
 naca0012.define_bc()
 farfield.define_bc()
 surface_domain.define_bc()
@@ -34,7 +34,7 @@ def get_all_available_airfoil_names():
 def get_airfoil_file(airfoil_name):
     """
     Request the airfoil .dat file at m-selig.ae.illinois.edu and stores it (if found) in the
-    database folder
+    database folder, the request is skipped if a non-empty file is already in the database folder
 
     Parameters
     ----------
@@ -42,6 +42,12 @@ def get_airfoil_file(airfoil_name):
         name of the airfoil
     """
 
+    file_path = Path(database_dir, f"{airfoil_name}.dat")
+
+    # An empty file is left by an interrupted download, get it again
+    if file_path.exists() and file_path.stat().st_size > 0:
+        return
+
     if not database_dir.exists():
         database_dir.mkdir()
 
@@ -52,11 +58,8 @@ def get_airfoil_file(airfoil_name):
     if r.status_code != 200:
         raise Exception(f"Could not get airfoil {airfoil_name}")
 
-    file_path = Path(database_dir, f"{airfoil_name}.dat")
-
-    if not file_path.exists():
-        with open(file_path, "wb") as f:
-            f.write(r.content)
+    with open(file_path, "wb") as f:
+        f.write(r.content)
 
 
 def get_airfoil_points(airfoil_name):
@@ -119,8 +122,8 @@ def get_airfoil_points(airfoil_name):
     y = [*y_up, *y_lo]
 
     cloud_points = [(x[k], y[k], 0) for k in range(0, len(x))]
-    # remove duplicated points
-    return sorted(set(cloud_points), key=cloud_points.index)
+    # remove duplicated points (keeping the first occurrence order)
+    return np.array(list(dict.fromkeys(cloud_points)), dtype=np.float64)
 
 
 def NACA_4_digit_geom(NACA_name, nb_points=100):
@@ -136,8 +139,8 @@ def NACA_4_digit_geom(NACA_name, nb_points=100):
             the polar representation of the chord
     Returns
     -------
-    _ : int
-        return the 3d cloud of points representing the airfoil
+    _ : np.ndarray
+        return the 3d cloud of points representing the airfoil, array of shape (N, 3)
     """
 
     theta_line = np.linspace(0, np.pi, nb_points)
@@ -208,4 +211,4 @@ def NACA_4_digit_geom(NACA_name, nb_points=100):
     y = np.concatenate((y_u[:-1], np.flip(y_l[1:])), axis=0)
 
     # create the 3d points cloud
-    return [(x[k], y[k], 0) for k in range(0, len(x))]
+    return np.column_stack((x, y, np.zeros_like(x)))
@@ -2,11 +2,13 @@
 This script contain the definition of geometrical objects needed to build the geometry.
 """
 
-from operator import attrgetter
+import array
 import gmsh
 import numpy as np
 import math
-import sys
+
+# gmsh built-in kernel, bound once instead of looking it up at each call
+_geo = gmsh.model.geo
 
 
 class Point:
@@ -26,9 +28,14 @@ class Point:
     mesh_size : float
         If mesh_size is > 0, add a meshing constraint
             at that point
+    tag : int, optional
+        tag of the gmsh point if it is already created, otherwise
+            the gmsh point is created
     """
 
-    def __init__(self, x, y, z, mesh_size):
+    __slots__ = ("x", "y", "z", "mesh_size", "dim", "tag")
+
+    def __init__(self, x, y, z, mesh_size, tag=None):
 
         self.x = x
         self.y = y
@@ -37,8 +44,36 @@ class Point:
         self.dim = 0
 
         # create the gmsh object and store the tag of the geometric object
-        self.tag = gmsh.model.geo.addPoint(
-            self.x, self.y, self.z, self.mesh_size)
+        if tag is None:
+            tag = _geo.addPoint(
+                self.x, self.y, self.z, self.mesh_size)
+        self.tag = tag
+
+    @classmethod
+    def from_array(cls, coords, mesh_size):
+        """
+        Method to create many Point objects at once, the gmsh points are created
+        in a single loop over the coordinates
+
+        ...
+
+        Parameters
+        ----------
+        coords : array_like
+            array of shape (N, 3) with the positions x,y,z of the points
+        mesh_size : float
+            attribute given to all the points
+
+        Returns
+        -------
+        _ : list(Point)
+            the Point objects, in the same order as coords
+        """
+        add_point = _geo.addPoint
+        return [
+            cls(x, y, z, mesh_size, add_point(x, y, z, mesh_size))
+            for x, y, z in np.ascontiguousarray(coords, dtype=np.float64).tolist()
+        ]
 
     def rotation(self, angle, origin, axis):
         """
@@ -53,7 +88,7 @@ class Point:
         axis : tuple
             tuple of point (x,y,z) which represent the axis of rotation
         """
-        gmsh.model.geo.rotate(
+        _geo.rotate(
             [(self.dim, self.tag)],
             *origin,
             *axis,
@@ -71,7 +106,7 @@ class Point:
         direction : tuple
             tuple of point (x,y,z) which represent the direction of the translation
         """
-        gmsh.model.geo.translate([(self.dim, self.tag)], *vector)
+        _geo.translate([(self.dim, self.tag)], *vector)
 
 
 class Line:
@@ -86,17 +121,24 @@ class Line:
         first point of the line
     end_point : Point
         second point of the line
+    tag : int, optional
+        tag of the gmsh line if it is already created, otherwise
+            the gmsh line is created
     """
 
-    def __init__(self, start_point, end_point):
+    __slots__ = ("start_point", "end_point", "dim", "tag")
+
+    def __init__(self, start_point, end_point, tag=None):
         self.start_point = start_point
         self.end_point = end_point
 
         self.dim = 1
 
         # create the gmsh object and store the tag of the geometric object
-        self.tag = gmsh.model.geo.addLine(
-            self.start_point.tag, self.end_point.tag)
+        if tag is None:
+            tag = _geo.addLine(
+                self.start_point.tag, self.end_point.tag)
+        self.tag = tag
 
     def rotation(self, angle, origin, axis):
         """
@@ -112,7 +154,7 @@ class Line:
         axis : tuple
             tuple of point (x,y,z) which represent the axis of rotation
         """
-        gmsh.model.geo.rotate(
+        _geo.rotate(
             [(self.dim, self.tag)],
             *origin,
             *axis,
@@ -129,7 +171,7 @@ class Line:
         direction : tuple
             tuple of point (x,y,z) which represent the direction of the translation
         """
-        gmsh.model.geo.translate([(self.dim, self.tag)], *vector)
+        _geo.translate([(self.dim, self.tag)], *vector)
 
 
 class Spline:
@@ -142,22 +184,28 @@ class Spline:
     ----------
     points_list : list(Point)
         list of Point object forming the Spline
+    tag_list : sequence(int), optional
+        tags of the points of point_list, if they are already known
     """
 
-    def __init__(self, point_list):
+    __slots__ = ("point_list", "tag_list", "dim", "tag")
+
+    def __init__(self, point_list, tag_list=None):
         self.point_list = point_list
 
-        # generate the Lines tag list to follow
-        self.tag_list = [point.tag for point in self.point_list]
+        # generate the Lines tag list to follow (packed array, read without copy by gmsh)
+        if tag_list is None:
+            tag_list = (point.tag for point in self.point_list)
+        self.tag_list = array.array("i", tag_list)
         self.dim = 1
         # create the gmsh object and store the tag of the geometric object
-        self.tag = gmsh.model.geo.addSpline(self.tag_list)
+        self.tag = _geo.addSpline(self.tag_list)
 
     def rotation(self, angle, origin, axis):
         """
         Method to rotate the object Spline
 
-        Rotate the spline itself (curve, startpoint, endpoint), then rotate the intermediate points
+        Rotate the spline itself (curve, startpoint, endpoint) and the intermediate points in one call
         ...
 
         Parameters
@@ -169,23 +217,19 @@ class Spline:
         axis : tuple
             tuple of point (x,y,z) which represent the axis of rotation
         """
-        gmsh.model.geo.rotate(
-            [(self.dim, self.tag)],
+        _geo.rotate(
+            [(self.dim, self.tag)]
+            + [(0, interm_point.tag) for interm_point in self.point_list[1:-1]],
             *origin,
             *axis,
             angle,
         )
 
-        [
-            interm_point.rotation(angle, origin, axis)
-            for interm_point in self.point_list[1:-1]
-        ]
-
     def translation(self, vector):
         """
         Method to translate the object Line
 
-        Translate the spline itself (curve, startpoint,endpoint), then translate the indermediate points
+        Translate the spline itself (curve, startpoint, endpoint) and the intermediate points in one call
         ...
 
         Parameters
@@ -193,9 +237,11 @@ class Spline:
         direction : tuple
             tuple of point (x,y,z) which represent the direction of the translation
         """
-        gmsh.model.geo.translate([(self.dim, self.tag)], *vector)
-        [interm_point.translation(vector)
-         for interm_point in self.point_list[1:-1]]
+        _geo.translate(
+            [(self.dim, self.tag)]
+            + [(0, interm_point.tag) for interm_point in self.point_list[1:-1]],
+            *vector,
+        )
 
 
 class CurveLoop:
@@ -213,14 +259,16 @@ class CurveLoop:
         Possibility to give either the tags directly, or the object Line
     """
 
+    __slots__ = ("line_list", "dim", "tag_list", "tag", "bc", "physical_name")
+
     def __init__(self, line_list):
 
         self.line_list = line_list
         self.dim = 1
         # generate the Lines tag list to follow
-        self.tag_list = [line.tag for line in self.line_list]
+        self.tag_list = array.array("i", (line.tag for line in self.line_list))
         # create the gmsh object and store the tag of the geometric object
-        self.tag = gmsh.model.geo.addCurveLoop(self.tag_list)
+        self.tag = _geo.addCurveLoop(self.tag_list)
 
     def close_loop(self):
         """
@@ -249,6 +297,8 @@ class CurveLoop:
 class Circle:
     """
     A class to represent a Circle geometrical object, composed of many arcCircle object of gmsh
+    The geometry is not synchronized at creation, gmsh.model.geo.synchronize() must be called
+    before using the entities in the model (e.g. before define_bc)
 
     ...
 
@@ -267,6 +317,11 @@ class Circle:
         resulting circle will be composed of
     """
 
+    __slots__ = (
+        "xc", "yc", "zc", "radius", "mesh_size", "dim", "distribution", "arcCircle_list",
+        "bc", "physical_name",
+    )
+
     def __init__(self, xc, yc, zc, radius, mesh_size):
         # Position of the disk center
         self.xc = xc
@@ -280,37 +335,38 @@ class Circle:
         # create multiples ArcCircle to merge in one circle
 
         # first compute how many points on the circle (for the meshing to be alined with the points)
-        self.distribution = math.floor(
-            (np.pi * 2 * self.radius) / self.mesh_size)
-        realmeshsize = (np.pi * 2 * self.radius)/self.distribution
-
-        # Create the center of the circle
-        center = Point(self.xc, self.yc, self.zc, realmeshsize)
-
-        # Create all the points for the circle
-        points = []
-        for i in range(0, self.distribution):
-            angle = 2 * np.pi / self.distribution * i
-            p = Point(self.xc+self.radius*math.cos(angle), self.yc+self.radius *
-                      math.sin(angle), self.zc, realmeshsize)
-            points.append(p)
-        # Add the first point last for continuity when creating the arcs
-        points.append(points[0])
+        perimeter = math.tau * self.radius
+        self.distribution = int(perimeter / self.mesh_size)
+        realmeshsize = perimeter / self.distribution
+
+        # Create the center of the circle (the points of the circle are only needed
+        # through their tag, so no Point object is created for them)
+        add_point = _geo.addPoint
+        center_tag = add_point(self.xc, self.yc, self.zc, realmeshsize)
+
+        # Compute all the points coordinates of the circle at once
+        theta = np.arange(self.distribution) * (math.tau / self.distribution)
+        xs = self.xc + self.radius * np.cos(theta)
+        ys = self.yc + self.radius * np.sin(theta)
+
+        # Create the points of the circle
+        pt_tags = [
+            add_point(x, y, self.zc, realmeshsize)
+            for x, y in zip(xs.tolist(), ys.tolist())
+        ]
 
         # Create arcs between two neighbouring points to create a circle
+        # (the last arc ends on the first point, so no duplicated points are created)
+        add_arc = _geo.addCircleArc
         self.arcCircle_list = [
-            gmsh.model.geo.addCircleArc(
-                points[i].tag,
-                center.tag,
-                points[i+1].tag,
+            add_arc(
+                pt_tags[i],
+                center_tag,
+                pt_tags[(i + 1) % self.distribution],
             )
             for i in range(0, self.distribution)
         ]
 
-        # Remove the duplicated points generated by the arcCircle
-        gmsh.model.geo.synchronize()
-        gmsh.model.geo.removeAllDuplicates()
-
     def close_loop(self):
         """
         Method to form a close loop with the current geometrical object
@@ -320,7 +376,7 @@ class Circle:
         _ : int
             return the tag of the CurveLoop object
         """
-        return gmsh.model.geo.addCurveLoop(self.arcCircle_list)
+        return _geo.addCurveLoop(self.arcCircle_list)
 
     def define_bc(self):
         """
@@ -347,15 +403,12 @@ class Circle:
         axis : tuple
             tuple of point (x,y,z) which represent the axis of rotation
         """
-        [
-            gmsh.model.geo.rotate(
-                [(self.dim, arccircle)],
-                *origin,
-                *axis,
-                angle,
-            )
-            for arccircle in self.arcCircle_list
-        ]
+        _geo.rotate(
+            [(self.dim, arccircle) for arccircle in self.arcCircle_list],
+            *origin,
+            *axis,
+            angle,
+        )
 
     def translation(self, vector):
         """
@@ -367,15 +420,16 @@ class Circle:
         direction : tuple
             tuple of point (x,y,z) which represent the direction of the translation
         """
-        [
-            gmsh.model.geo.translate([(self.dim, arccircle)], *vector)
-            for arccircle in self.arcCircle_list
-        ]
+        _geo.translate(
+            [(self.dim, arccircle) for arccircle in self.arcCircle_list], *vector
+        )
 
 
 class Rectangle:
     """
     A class to represent a rectangle geometrical object, composed of 4 Lines object of gmsh
+    The geometry is not synchronized at creation, gmsh.model.geo.synchronize() must be called
+    before using the entities in the model (e.g. before define_bc)
 
     ...
 
@@ -395,6 +449,11 @@ class Rectangle:
         attribute given for the class Point
     """
 
+    __slots__ = (
+        "xc", "yc", "z", "dx", "dy", "mesh_size", "dim", "points", "lines",
+        "bc_in", "bc_out", "bc_wall", "bc",
+    )
+
     def __init__(self, xc, yc, z, dx, dy, mesh_size):
 
         self.xc = xc
@@ -407,17 +466,15 @@ class Rectangle:
         self.mesh_size = mesh_size
         self.dim = 1
         # Generate the 4 corners of the rectangle
+        hx, hy = self.dx * 0.5, self.dy * 0.5
+        x0, x1 = self.xc - hx, self.xc + hx
+        y0, y1 = self.yc - hy, self.yc + hy
         self.points = [
-            Point(self.xc - self.dx / 2, self.yc -
-                  self.dy / 2, z, self.mesh_size),
-            Point(self.xc + self.dx / 2, self.yc -
-                  self.dy / 2, z, self.mesh_size),
-            Point(self.xc + self.dx / 2, self.yc +
-                  self.dy / 2, z, self.mesh_size),
-            Point(self.xc - self.dx / 2, self.yc +
-                  self.dy / 2, z, self.mesh_size),
+            Point(x0, y0, z, self.mesh_size),
+            Point(x1, y0, z, self.mesh_size),
+            Point(x1, y1, z, self.mesh_size),
+            Point(x0, y1, z, self.mesh_size),
         ]
-        gmsh.model.geo.synchronize()
 
         # Generate the 4 lines of the rectangle
         self.lines = [
@@ -427,8 +484,6 @@ class Rectangle:
             Line(self.points[3], self.points[0]),
         ]
 
-        gmsh.model.geo.synchronize()
-
     def close_loop(self):
         """
         Method to form a close loop with the current geometrical object
@@ -438,7 +493,7 @@ class Rectangle:
         _ : int
             return the tag of the CurveLoop object
         """
-        return CurveLoop(self.lines).tag
+        return _geo.addCurveLoop([line.tag for line in self.lines])
 
     def define_bc(self):
         """
@@ -479,7 +534,12 @@ class Rectangle:
         axis : tuple
             tuple of point (x,y,z) which represent the axis of rotation
         """
-        [line.rotation(angle, origin, axis) for line in self.lines]
+        _geo.rotate(
+            [(line.dim, line.tag) for line in self.lines],
+            *origin,
+            *axis,
+            angle,
+        )
 
     def translation(self, vector):
         """
@@ -491,7 +551,9 @@ class Rectangle:
         direction : tuple
             tuple of point (x,y,z) which represent the direction of the translation
         """
-        [line.translation(vector) for line in self.lines]
+        _geo.translate(
+            [(line.dim, line.tag) for line in self.lines], *vector
+        )
 
 
 class Airfoil:
@@ -515,15 +577,16 @@ class Airfoil:
         boundary condition
     """
 
+    __slots__ = ("name", "dim", "points", "coords", "tags", "lines_tag", "bc")
+
     def __init__(self, point_cloud, mesh_size, name="airfoil"):
 
         self.name = name
         self.dim = 1
         # Generate Points object from the point_cloud
-        self.points = [
-            Point(point_cord[0], point_cord[1], point_cord[2], mesh_size)
-            for point_cord in point_cloud
-        ]
+        self.coords = np.array(point_cloud, dtype=np.float64)
+        self.points = Point.from_array(self.coords, mesh_size)
+        self.tags = _point_tags(self.points)
 
     def gen_skin(self):
         """
@@ -531,11 +594,13 @@ class Airfoil:
         of the airfoil are in their final position
         -------
         """
-        self.lines = [
-            Line(self.points[i], self.points[i + 1])
-            for i in range(-1, len(self.points) - 1)
-        ]
-        self.lines_tag = [line.tag for line in self.lines]
+        # Link each point to the next one, starting with the line closing the loop (last to first point)
+        add_line = _geo.addLine
+        tags = self.tags
+        self.lines_tag = array.array("i", (
+            add_line(start_tag, end_tag)
+            for start_tag, end_tag in zip(tags[-1:] + tags[:-1], tags)
+        ))
 
     def close_loop(self):
         """
@@ -546,7 +611,7 @@ class Airfoil:
         _ : int
             return the tag of the CurveLoop object
         """
-        return CurveLoop(self.lines).tag
+        return _geo.addCurveLoop(self.lines_tag)
 
     def define_bc(self):
         """
@@ -571,7 +636,12 @@ class Airfoil:
         axis : tuple
             tuple of point (x,y,z) which represent the axis of rotation
         """
-        [point.rotation(angle, origin, axis) for point in self.points]
+        _geo.rotate(
+            [(0, tag) for tag in self.tags],
+            *origin,
+            *axis,
+            angle,
+        )
 
     def translation(self, vector):
         """
@@ -583,12 +653,160 @@ class Airfoil:
         direction : tuple
             tuple of point (x,y,z) which represent the direction of the translation
         """
-        [point.translation(vector) for point in self.points]
+        _geo.translate(
+            [(0, tag) for tag in self.tags], *vector
+        )
+
+
+def _point_tags(points):
+    """
+    Function that gathers the tags of a list of Point objects in a packed array
+
+    Parameters
+    ----------
+    points : list(Point)
+        the points of the airfoil
+
+    Returns
+    -------
+    _ : array.array
+        the tags of the points, in the same order
+    """
+    return array.array("i", (point.tag for point in points))
+
+
+def _classify_te(xs, te_indx):
+    """
+    Function that checks if the airfoil ends in a single point, or with two different
+    points (vertical of each other)
+
+    Parameters
+    ----------
+    xs : np.ndarray
+        x coordinates of the points of the airfoil
+    te_indx : int
+        index of the trailing edge (point with the biggest x)
+
+    Returns
+    -------
+    _ : tuple(int, int, bool)
+        index of the upper and lower trailing edge points (in [0, len(xs)), the list
+        being closed the lower one is 0 when the upper one is the last point), and
+        whether the trailing edge is vertical (if not, the indices are -1)
+    """
+    n = len(xs)
+    # index of the point before and after the trailing edge (the list is closed)
+    prev_indx, next_indx = (te_indx-1) % n, (te_indx+1) % n
+    threshold = xs[te_indx]-0.0001
+    # If two (in the end) are so close in coordinate x, they are vertical and not just neighbouring point
+    # Just need to check if the one before or after and then label them correctly
+    if xs[prev_indx] > threshold:
+        return prev_indx, te_indx, True
+    if xs[next_indx] > threshold:
+        return te_indx, next_indx, True
+    return -1, -1, False
+
+
+def _front_bounds(xs, threshold):
+    """
+    Function that finds the limits of the front part of the airfoil, i.e. the first
+    point after threshold (upper part) and the last one before coming back under it
+    (lower part)
+
+    Parameters
+    ----------
+    xs : np.ndarray
+        x coordinates of the points of the airfoil, starting at the leading edge
+    threshold : float
+        x coordinate delimiting the front part
+
+    Returns
+    -------
+    _ : tuple(int, int)
+        index of the upper and lower limit points
+    """
+    behind = xs > threshold
+    k1 = int(behind.argmax())
+    k2 = k1 + int((~behind[k1:]).argmax()) - 1
+    return k1, k2
+
+
+# Outcomes of _te_point
+_TE_INTERSECTION, _TE_NOTHING, _TE_CLAMPED = 0, 1, 2
+
+
+def _te_point(q, te_x):
+    """
+    Function that computes the pointy trailing edge to add to an airfoil ending with
+    two points vertical of each other
+
+    Parameters
+    ----------
+    q : np.ndarray
+        array of shape (4, 2) with the coordinates x,y of, in the order, the point p1
+        before the upper trailing edge point, the upper and the lower trailing edge points
+        and the point p2 after the lower trailing edge point
+    te_x : float
+        x coordinate of the trailing edge
+
+    Returns
+    -------
+    _ : tuple(float, float, int)
+        coordinates of the new trailing edge point and the outcome: _TE_INTERSECTION
+        (meetpoint of the prolongations), _TE_CLAMPED (constrained point) or _TE_NOTHING
+        (no point to add, the coordinates are then meaningless)
+    """
+    (p1x, p1y), (x, y), (z, w), (p2x, p2y) = q.tolist()
+    a, b = x - p1x, y - p1y
+    c, d = z - p2x, w - p2y
+    #
+    # We have that (x,y) are the coordinates of te_up and (z,w) the coordinates of te_down
+    # p1 is the point before te_up and p2 the point after te_down
+    #      \
+    #       . p1
+    #        \ vector from p1 to (x,y) is (a,b)
+    #         \
+    #          . (x,y)
+    #  p2
+    #  .----->.  . <- want to compute this point (which will be our new te)
+    #       (z,w)
+    #   vector from p2 to (z,w) is (c,d)
+    #
+
+    # We compute mu: solution from the system (x,y)+lambda(a,b)=(z,w)+mu(c,d) that gives us the intersection point
+    denom = b*c-a*d
+    if denom != 0:
+        mu = (b*(x-z)+a*(w-y))/denom
+    else:
+        # only happens with vr7b and vr8b (parallel edges so no solutions)
+        mu = 10000000.0
+        # will be treated in the else
+    new_x = z+mu*c
+
+    # Now to be coherent, we want the pointy edge to have a x coordinate between te.x and 0.1 further
+    if te_x < new_x <= te_x + 0.1:
+        return new_x, w+mu*d, _TE_INTERSECTION
+
+    # If not, it can be in the wrong direction (like with oaf095) or absurdly far (like with hh02), and so we constrain it
+    # (happens with roughly 40 airfoils, most because not well discretized)
+
+    # First we take off the ones in this case (new would be so close) are the one not well coded with two really close horizontally points (like s2091). So we just don't do anything
+    if te_x-0.001 < new_x <= te_x:
+        return new_x, 0.0, _TE_NOTHING
+
+    # if too far or behind, we take the point p in the middle of (x,y) and (z,w), and add the vector mean of (a,b) and (c,d) until we reach 1.05 (or te +0.05 to be precise)
+    px, py = (x+z)/2, (y+w)/2
+    e, f = (a+c)/2, (b+d)/2
+    lambd = (te_x + 0.05-px)/e
+    return te_x + 0.05, py+lambd*f, _TE_CLAMPED
 
 
 class AirfoilSpline:
     """
     A class to represent and airfoil as a CurveLoop object formed with Splines
+    The geometry is not synchronized at creation nor after a rotation/translation,
+    gmsh.model.geo.synchronize() must be called before using the entities in the model
+    (e.g. before define_bc)
     ...
 
     Attributes
@@ -606,6 +824,11 @@ class AirfoilSpline:
         boundary condition
     """
 
+    __slots__ = (
+        "name", "dim", "mesh_size", "points", "coords", "le_indx", "te_indx", "le", "te",
+        "tags", "upper_spline", "lower_spline", "front_spline", "bc",
+    )
+
     def __init__(self, point_cloud, mesh_size,  name="airfoil"):
 
         self.name = name
@@ -613,84 +836,57 @@ class AirfoilSpline:
         self.mesh_size = mesh_size
 
         # Generate Points object from the point_cloud
-        self.points = [
-            Point(point_cord[0], point_cord[1], point_cord[2], mesh_size)
-            for point_cord in point_cloud
-        ]
+        self.coords = np.array(point_cloud, dtype=np.float64)
+        self.points = Point.from_array(self.coords, mesh_size)
+        xs = self.coords[:, 0]
 
         # Find leading and trailing edge location
-        # in space
-        self.le = min(self.points, key=attrgetter("x"))
-        self.te = max(self.points, key=attrgetter("x"))
         # in the list of point
-        self.te_indx = self.points.index(self.te)
-        self.le_indx = self.points.index(self.le)
+        self.le_indx = int(xs.argmin())
+        self.te_indx = int(xs.argmax())
+        # in space
+        self.le = self.points[self.le_indx]
+        self.te = self.points[self.te_indx]
+        te_x = xs[self.te_indx]
 
         # Check if the airfoil end in a single point, or with two different points (vertical of each other)
-        vertical = False
-        # If two (in the end) are so close in coordinate x, they are vertical and not just neighbouring point (examples below)
-        # Just need to check if the one before or after and then label them correctly
-        if self.points[self.te_indx-1].x > self.te.x-0.0001:
-            te_up_indx = self.te_indx-1
-            te_down_indx = self.te_indx
-            vertical = True
-        elif self.points[self.te_indx+1].x > self.te.x-0.0001:
-            te_up_indx = self.te_indx
-            te_down_indx = self.te_indx+1
-            vertical = True
+        te_up_indx, te_down_indx, vertical = _classify_te(xs, self.te_indx)
 
         # If end with two points, add one point in the prolongation of the curves to get pointy edge
         if vertical:
             # Compute the prolongation of the last segment and their meetpoint : it will be the new point
-            x, y, z, w = self.points[te_up_indx].x, self.points[
-                te_up_indx].y, self.points[te_down_indx].x, self.points[te_down_indx].y
-            a, b, c, d = x - self.points[te_up_indx-1].x, y-self.points[te_up_indx -
-                                                                        1].y, z-self.points[te_down_indx+1].x, w-self.points[te_down_indx+1].y
-            #
-            # We have that (x,y) are the coordinates of te_up and (z,w) the coordinates of te_down
-            # p1 is the point before te_up and p2 the point after te_down
-            #      \
-            #       . p1
-            #        \ vector from p1 to (x,y) is (a,b)
-            #         \
-            #          . (x,y)
-            #  p2
-            #  .----->.  . <- want to compute this point (which will be our new te)
-            #       (z,w)
-            #   vector from p2 to (z,w) is (c,d)
-            #
-
-            nothing = False
-            # We compute mu: solution from the system (x,y)+lambda(a,b)=(z,w)+mu(c,d) that gives us the intersection point
-            if b*c-a*d != 0:
-                mu = (b*(x-z)+a*(w-y))/(b*c-a*d)
-            else:
-                # only happens with vr7b and vr8b (parallel edges so no solutions)
-                mu = 10000000
-                # will be treated in the else
-
-            # Now to be coherent, we want the pointy edge to have a x coordinate between te.x and 0.1 further
-            if z+mu*c <= self.te.x + 0.1 and z+mu*c > self.te.x:
-                new = Point(z+mu*c, w+mu*d, 0, self.mesh_size)
-
-            # If not, it can be in the wrong direction (like with oaf095) or absurdly far (like with hh02), and so we constrain it
-            # (happens with roughly 40 airfoils, most because not well discretized)
-
-            # First we take off the ones in this case (new would be so close) are the one not well coded with two really close horizontally points (like s2091). So we just don't do anything
-            elif z+mu*c > self.te.x-0.001 and z+mu*c <= self.te.x:
-                nothing = True
-            else:
-                # if too far or behind, we take the point p in the middle of (x,y) and (z,w), and add the vector mean of (a,b) and (c,d) until we reach 1.05 (or te +0.05 to be precise)
-                px, py = (x+z)/2, (y+w)/2
-                e, f = (a+c)/2, (b+d)/2
-                lambd = (self.te.x + 0.05-px)/e
-                new = Point(self.te.x + 0.05, py+lambd*f, 0, self.mesh_size)
-
-            if not nothing:
-                # Now insert the point in th list of points and change the index for te to be the new point
-                self.points.insert(te_down_indx, new)
+            n = len(xs)
+            new_x, new_y, status = _te_point(
+                self.coords[[(te_up_indx-1) % n, te_up_indx, te_down_indx, (te_down_indx+1) % n], :2],
+                te_x)
+
+            if status != _TE_NOTHING:
+                # Now insert the point in th list of points (after te_up, i.e. at the end of the
+                # list when te_up is the last point) and change the index for te to be the new point
+                new_indx = te_up_indx + 1
+                new = Point(new_x, new_y, 0, self.mesh_size)
+                self.points.insert(new_indx, new)
+                self.coords = np.insert(
+                    self.coords, new_indx, (new.x, new.y, new.z), axis=0)
                 self.te = new
-                self.te_indx = te_down_indx
+                self.te_indx = new_indx
+
+        self.tags = _point_tags(self.points)
+
+    def _spline(self, start, end):
+        """
+        Method to create the Spline going through the points from index start to index end
+        (included), going back to the first point after the last one if end < start
+
+        Returns
+        -------
+        _ : Spline
+            the Spline object created
+        """
+        n = len(self.points)
+        indices = range(start, end + 1 + (n if end < start else 0))
+        tags = self.tags
+        return Spline([self.points[i % n] for i in indices], (tags[i % n] for i in indices))
 
     def gen_skin(self):
         """
@@ -699,26 +895,16 @@ class AirfoilSpline:
         -------
         """
         # Find the first point after 0.049 in the upper band lower spline
-        debut = True
-        for p in self.points:
-            if p.x > 0.049 and debut:
-                k1 = self.points.index(p)
-                debut = False
-            if p.x <= 0.049 and not debut:
-                k2 = self.points.index(p)-1
-                break
+        k1, k2 = _front_bounds(self.coords[:, 0], 0.049)
 
         # create a spline from the up middle point to the trailing edge (up part)
-        self.upper_spline = Spline(
-            self.points[k1: self.te_indx + 1])
+        self.upper_spline = self._spline(k1, self.te_indx)
 
         # create a spline from the trailing edge to the up down point (down part)
-        self.lower_spline = Spline(
-            self.points[self.te_indx:k2+1]
-        )
+        self.lower_spline = self._spline(self.te_indx, k2)
 
         # Create a spline for the front part of the airfoil
-        self.front_spline = Spline(self.points[k2:]+self.points[:k1+1])
+        self.front_spline = self._spline(k2, k1)
 
         return k1, k2
 
@@ -729,13 +915,10 @@ class AirfoilSpline:
         -------
         """
         # create a spline from the up middle point to the trailing edge (up part)
-        self.upper_spline = Spline(
-            self.points[k1: self.te_indx + 1])
+        self.upper_spline = self._spline(k1, self.te_indx)
 
         # create a spline from the trailing edge to the up down point (down part)
-        self.lower_spline = Spline(
-            self.points[self.te_indx:k2+1]
-        )
+        self.lower_spline = self._spline(self.te_indx, k2)
         return self.upper_spline, self.lower_spline
 
     def close_loop(self):
@@ -747,7 +930,8 @@ class AirfoilSpline:
         _ : int
             return the tag of the CurveLoop object
         """
-        return CurveLoop([self.upper_spline, self.lower_spline, self.front_spline]).tag
+        return _geo.addCurveLoop(
+            [self.upper_spline.tag, self.lower_spline.tag, self.front_spline.tag])
 
     def define_bc(self):
         """
@@ -775,8 +959,12 @@ class AirfoilSpline:
         axis : tuple
             tuple of point (x,y,z) which represent the axis of rotation
         """
-        [point.rotation(angle, origin, axis) for point in self.points]
-        gmsh.model.geo.synchronize()
+        _geo.rotate(
+            [(0, tag) for tag in self.tags],
+            *origin,
+            *axis,
+            angle,
+        )
 
     def translation(self, vector):
         """
@@ -788,7 +976,9 @@ class AirfoilSpline:
         direction : tuple
             tuple of point (x,y,z) which represent the direction of the translation
         """
-        [point.translation(vector) for point in self.points]
+        _geo.translate(
+            [(0, tag) for tag in self.tags], *vector
+        )
 
 
 class PlaneSurface:
@@ -807,16 +997,18 @@ class PlaneSurface:
 
     """
 
+    __slots__ = ("geom_objects", "tag_list", "dim", "tag", "ps")
+
     def __init__(self, geom_objects):
 
         self.geom_objects = geom_objects
         # close_loop() will form a close loop object and return its tag
-        self.tag_list = [geom_object.close_loop()
-                         for geom_object in self.geom_objects]
+        self.tag_list = array.array(
+            "i", (geom_object.close_loop() for geom_object in self.geom_objects))
         self.dim = 2
 
         # create the gmsh object and store the tag of the geometric object
-        self.tag = gmsh.model.geo.addPlaneSurface(self.tag_list)
+        self.tag = _geo.addPlaneSurface(self.tag_list)
 
     def define_bc(self):
         """
@@ -827,6 +1019,12 @@ class PlaneSurface:
         gmsh.model.setPhysicalName(self.dim, self.ps, "fluid")
 
 
+class OutOfBoundsError(Exception):
+    """
+    Exception raised when the boundary layer or the airfoil goes out of the box/farfield
+    """
+
+
 def outofbounds(airfoil, box, radius, blthick):
     """Method that checks if the boundary layer or airfoil goes out of the box/farfield
     (which is a problem for meshing later)
@@ -840,33 +1038,53 @@ def outofbounds(airfoil, box, radius, blthick):
             radius of the farfield
         blthick (float):
             total thickness of the boundary layer (0 for mesh without bl)
+
+    Raises:
+        OutOfBoundsError: if the boundary layer or airfoil does not fit in the domain
     """
     if box:
         length, width = [float(value) for value in box.split("x")]
         # Compute the min and max values in the x and y directions
-        minx = min(p.x for p in airfoil.points)
-        maxx = max(p.x for p in airfoil.points)
-        miny = min(p.y for p in airfoil.points)
-        maxy = max(p.y for p in airfoil.points)
+        xs, ys = airfoil.coords[:, 0], airfoil.coords[:, 1]
+        minx, maxx = xs.min(), xs.max()
+        miny, maxy = ys.min(), ys.max()
         # Check :
         # If the max-0.5 (which is just recentering the airfoil in 0)+bl thickness value is bigger than length/2 --> too far right.
         # Same with min and left. (minx & maxx should be 0 & 1 but we recompute to be sure)
         # Same in y.
         if abs(maxx-0.5)+abs(blthick) > length/2 or abs(minx-0.5)+abs(blthick) > length/2 or abs(maxy)+abs(blthick) > width/2 or abs(miny)+abs(blthick) > width/2:
-            print("\nThe boundary layer or airfoil is bigger than the box, exiting")
-            print(
-                "You must change the boundary layer parameters or choose a bigger box\n")
-            sys.exit()
+            raise OutOfBoundsError(
+                "The boundary layer or airfoil is bigger than the box\n"
+                "You must change the boundary layer parameters or choose a bigger box")
     else:
         # Compute the further from (0.5,0,0) a point is (norm of (x-0.5,y))
-        maxr = math.sqrt(max((p.x-0.5)*(p.x-0.5)+p.y*p.y
-                             for p in airfoil.points))
+        maxr = np.hypot(airfoil.coords[:, 0]-0.5, airfoil.coords[:, 1]).max()
         # Check if furthest + bl is bigger than radius
         if maxr+abs(blthick) > radius:
-            print("\nThe boundary layer or airfoil is bigger than the circle, exiting")
-            print(
-                "You must change the boundary layer parameters or choose a bigger radius\n")
-            sys.exit()
+            raise OutOfBoundsError(
+                "The boundary layer or airfoil is bigger than the circle\n"
+                "You must change the boundary layer parameters or choose a bigger radius")
+
+
+def _rotate_xy(xy, angle):
+    """
+    Function that rotates 2D coordinates around the origin
+
+    Parameters
+    ----------
+    xy : np.ndarray
+        array of shape (N, 2) with the coordinates x,y
+    angle : float
+        angle of rotation in rad
+
+    Returns
+    -------
+    _ : np.ndarray
+        array of shape (N, 2) with the rotated coordinates
+    """
+    cos, sin = math.cos(angle), math.sin(angle)
+    x, y = xy[:, 0], xy[:, 1]
+    return np.column_stack((cos*x - sin*y, sin*x + cos*y))
 
 
 class CType:
@@ -891,17 +1109,13 @@ class CType:
         self.ratio = ratio
         self.aoa = aoa
 
+        # Leading and trailing edge of the airfoil, used all along the construction
+        le, te = airfoil_spline.le, airfoil_spline.te
+
         # First compute k1 & k2 the first coordinate after 0.041 (up & down)
-        debut = True
-        for p in airfoil_spline.points:
-            if p.x > 0.041 and debut:
-                k1 = airfoil_spline.points.index(p)
-                debut = False
-            if p.x <= 0.041 and not debut:
-                k2 = airfoil_spline.points.index(p)-1
-                break
-
-        upper_spline_back, lower_spline_back = self.airfoil_spline.gen_skin_struct(
+        k1, k2 = _front_bounds(airfoil_spline.coords[:, 0], 0.041)
+
+        upper_spline_back, lower_spline_back = airfoil_spline.gen_skin_struct(
             k1, k2)
         self.le_upper_point = airfoil_spline.points[k1]
         self.le_lower_point = airfoil_spline.points[k2]
@@ -911,7 +1125,7 @@ class CType:
         lower_points_front = airfoil_spline.points[k2:]
         points_front = lower_points_front + upper_points_front
         points_front_tag = [point.tag for point in points_front]
-        spline_front = gmsh.model.geo.addSpline(points_front_tag)
+        spline_front = _geo.addSpline(points_front_tag)
         self.spline_front, self.upper_spline_back, self.lower_spline_back = spline_front, upper_spline_back, lower_spline_back
 
         # Create points on the outside domain (& center point)
@@ -931,68 +1145,62 @@ class CType:
 
         # We want the line to p1 to be perpendicular to airfoil for better boundary layer, and same for p2
         # We compute the normal to the line linking the points before and after our point of separation (point[k1]&point[k2])
-        xup, yup, xdown, ydown = airfoil_spline.points[k1].x, airfoil_spline.points[
-            k1].y,  airfoil_spline.points[k2].x, airfoil_spline.points[k2].y
-        xupbefore, yupbefore, xupafter, yupafter = airfoil_spline.points[
-            k1-1].x, airfoil_spline.points[k1-1].y, airfoil_spline.points[k1+1].x, airfoil_spline.points[k1+1].y
-        xdownbefore, ydownbefore, xdownafter, ydownafter = airfoil_spline.points[
-            k2-1].x, airfoil_spline.points[k2-1].y, airfoil_spline.points[k2+1].x, airfoil_spline.points[k2+1].y
-        directionupx, directionupy, directiondownx, directiondowny = yupbefore - \
-            yupafter, xupafter-xupbefore, ydownafter-ydownbefore, xdownbefore-xdownafter
+        xy = airfoil_spline.coords[:, :2]
+        up_before, up_after = xy[k1-1], xy[k1+1]
+        down_before, down_after = xy[k2-1], xy[k2+1]
+        directions = np.array([
+            (up_before[1]-up_after[1], up_after[0]-up_before[0]),
+            (down_after[1]-down_before[1], down_before[0]-down_after[0]),
+        ])
         # As the points coordinates we get are not rotated, we need to change it by hand
-        cos, sin = math.cos(aoa), math.sin(aoa)
-        directionupx, directionupy, directiondownx, directiondowny = cos*directionupx-sin * directionupy, sin * \
-            directionupx+cos * directionupy, cos*directiondownx-sin * \
-            directiondowny, sin*directiondownx+cos * directiondowny
-        xup, yup, xdown, ydown = cos*xup-sin*yup, sin*xup + \
-            cos*yup, cos*xdown-sin*ydown, sin*xdown+cos*ydown
+        (directionupx, directionupy), (directiondownx, directiondowny) = _rotate_xy(
+            directions, aoa).tolist()
+        (xup, yup), (xdown, ydown) = _rotate_xy(xy[[k1, k2]], aoa).tolist()
 
         # Then compute where the line in this direction going from point[k1] intersect the line y=dy/2 (i.e. the horizontal line where we want L1)
         pt1x, pt1y, pt7x, pt7y = xup+(dy/2-yup)/directionupy*directionupx, dy/2, xdown + \
             (0-dy/2-ydown)/directiondowny*directiondownx, -dy/2
         # Check that the line doesn't go "back" or "too far", and constrain it to go between le-0.05*dy and le-3.5
-        pt1x = max(min(pt1x, airfoil_spline.le.x-0.05*dy),
-                   airfoil_spline.le.x-3.5)
-        pt7x = max(min(pt7x, airfoil_spline.le.x-0.05*dy),
-                   airfoil_spline.le.x-3.5)
+        pt1x = max(min(pt1x, le.x-0.05*dy), le.x-3.5)
+        pt7x = max(min(pt7x, le.x-0.05*dy), le.x-3.5)
         # Compute the center of the circle : we want a x coordinate of 0.5, and compute cy so that p1 and p7 are at same distance from the (0.5,cy)
         centery = (pt1y+pt7y)/2 + (0.5-(pt1x+pt7x)/2)/(pt1y-pt7y)*(pt7x-pt1x)
 
-        # Create the 8 points we wanted
-        self.points = [
-            Point(0.5, centery, z, self.mesh_size_end),  # 0
-            Point(pt1x, pt1y, z, self.mesh_size_end),  # 1
-            Point(self.airfoil_spline.te.x, self.dy /
-                  2, z, self.mesh_size_end),  # 2
-            Point(self.airfoil_spline.te.x + self.dx_trail,
-                  self.dy / 2, z, self.mesh_size_end),  # 3
-            Point(self.airfoil_spline.te.x + self.dx_trail,
-                  self.airfoil_spline.te.y, z, self.mesh_size_end),  # 4
-            Point(self.airfoil_spline.te.x + self.dx_trail, -
-                  self.dy / 2, z, self.mesh_size_end),  # 5
-            Point(self.airfoil_spline.te.x, -
-                  self.dy / 2, z, self.mesh_size_end),  # 6
-            Point(pt7x, pt7y, z, self.mesh_size_end),  # 7
-        ]
+        # Create the 8 points we wanted, without mesh size (0) since all the curves
+        # of the domain are transfinite and define the nodes themselves
+        self.points = points = Point.from_array([
+            (0.5, centery, z),  # 0
+            (pt1x, pt1y, z),  # 1
+            (te.x, dy / 2, z),  # 2
+            (te.x + dx_trail, dy / 2, z),  # 3
+            (te.x + dx_trail, te.y, z),  # 4
+            (te.x + dx_trail, - dy / 2, z),  # 5
+            (te.x, - dy / 2, z),  # 6
+            (pt7x, pt7y, z),  # 7
+        ], 0)
 
         # Create all the lines : outside and surface separation
-        self.lines = [
-            Line(self.le_upper_point, self.points[1]),  # 0
-            Line(self.points[1], self.points[2]),  # 1
-            Line(self.points[2], self.points[3]),  # 2
-            Line(self.points[3], self.points[4]),  # 3
-            Line(self.points[4], self.points[5]),  # 4
-            Line(self.points[5], self.points[6]),  # 5
-            Line(self.points[6], self.points[7]),  # 6
-            Line(self.points[7], self.le_lower_point),  # 7
-            Line(self.airfoil_spline.te, self.points[2]),  # 8
-            Line(self.airfoil_spline.te, self.points[6]),  # 9
-            Line(self.points[4], self.airfoil_spline.te),  # 10
+        line_ends = [
+            (self.le_upper_point, points[1]),  # 0
+            (points[1], points[2]),  # 1
+            (points[2], points[3]),  # 2
+            (points[3], points[4]),  # 3
+            (points[4], points[5]),  # 4
+            (points[5], points[6]),  # 5
+            (points[6], points[7]),  # 6
+            (points[7], self.le_lower_point),  # 7
+            (te, points[2]),  # 8
+            (te, points[6]),  # 9
+            (points[4], te),  # 10
+        ]
+        add_line = _geo.addLine
+        self.lines = lines = [
+            Line(start, end, add_line(start.tag, end.tag)) for start, end in line_ends
         ]
 
         # Circle arc for C shape at the front
-        self.circle_arc = gmsh.model.geo.addCircleArc(
-            self.points[7].tag, self.points[0].tag, self.points[1].tag)
+        self.circle_arc = _geo.addCircleArc(
+            points[7].tag, points[0].tag, points[1].tag)
 
         # planar surfaces for structured grid are named from A-E
         # straight lines are numbered from L0 to L10
@@ -1037,7 +1245,7 @@ class CType:
             coeffdiv = 3
         else:
             coeffdiv = 2
-        a, b, l = mesh_size_end/coeffdiv, mesh_size_end, airfoil_spline.te.x
+        a, b, l = mesh_size_end/coeffdiv, mesh_size_end, te.x
         # So compute ratio and nb of points accordingly: (solve l=a+a*r+a*r^2+a*r^(N-1) and a*r^(N-1)=b, and N=nb of intervals=nb of points-1)
         ratio_airfoil = (l-a)/(l-b)
         if l-b < 0:
@@ -1050,121 +1258,97 @@ class CType:
         # First we estimate the length of the spline
         x, y, v, w = airfoil_spline.points[k1].x, airfoil_spline.points[
             k2].y, airfoil_spline.points[k1].x, airfoil_spline.points[k2].y
-        c1, c2 = airfoil_spline.le.x, airfoil_spline.le.y
-        estim_length = (math.sqrt((x-c1)*(x-c1)+(y-c2)*(y-c2)) +
-                        math.sqrt((v-c1)*(v-c1)+(w-c2)*(w-c2)))+0.01
+        c1, c2 = le.x, le.y
+        estim_length = math.hypot(x-c1, y-c2) + math.hypot(v-c1, w-c2) + 0.01
         # Compute nb of points if they were all same size, multiply par a factor (3) to have an okay number (and good when apply bump)
         nb_airfoil_front = max(
             4, int(estim_length/mesh_size_end*coeffdiv*3))+4
 
         # Now we set all the corresponding transfinite curve we need (with our coefficient computed before)
 
-        # transfinite curve A
-        gmsh.model.geo.mesh.setTransfiniteCurve(
-            self.lines[7].tag, nb_points_y, "Progression", progression_y_inv)  # same for plane E
-        if mesh_size_end < 0.04:
-            gmsh.model.geo.mesh.setTransfiniteCurve(
-                spline_front, nb_airfoil_front, "Bump", 12)
-        else:
-            gmsh.model.geo.mesh.setTransfiniteCurve(
-                spline_front, nb_airfoil_front, "Bump", 7)
-        gmsh.model.geo.mesh.setTransfiniteCurve(
-            self.lines[0].tag, nb_points_y, "Progression", progression_y)  # same for plane B
+        # Bump of the front spline, stronger for small mesh sizes
+        bump_front = 12 if mesh_size_end < 0.04 else 7
         # Because of different length of L1 and L6, need a bigger coefficient when point 1 and 7 are really far (coef is 1 when far and 9 when close)
         coef = 8/3*(pt1x+pt7x)/2+31/3
         if dy < 6:
             coef = (coef+2)/3
         if dy <= 3:
             coef = (coef + 2)/3
-        gmsh.model.geo.mesh.setTransfiniteCurve(
-            self.circle_arc, nb_airfoil_front, "Bump", 1/coef)
-
-        # transfinite curve B
-        gmsh.model.geo.mesh.setTransfiniteCurve(
-            self.lines[8].tag, nb_points_y, "Progression", progression_y)  # same for plane C
-        gmsh.model.geo.mesh.setTransfiniteCurve(
-            upper_spline_back.tag, nb_airfoil, "Progression", ratio_airfoil)
         # For L1, we adapt depeding if the curve is much longer than 1 or not (if goes "far in the front")
-        if pt1x < airfoil_spline.le.x-1.5:
-            gmsh.model.geo.mesh.setTransfiniteCurve(
-                self.lines[1].tag, nb_airfoil, "Progression", 1/ratio_airfoil)
-        elif pt1x < airfoil_spline.le.x-0.7:
-            gmsh.model.geo.mesh.setTransfiniteCurve(
-                self.lines[1].tag, nb_airfoil, "Progression", 1/math.sqrt(ratio_airfoil))
+        if pt1x < le.x-1.5:
+            progression_l1 = 1/ratio_airfoil
+        elif pt1x < le.x-0.7:
+            progression_l1 = 1/math.sqrt(ratio_airfoil)
         else:
-            gmsh.model.geo.mesh.setTransfiniteCurve(
-                self.lines[1].tag, nb_airfoil)
-
-        # transfinite curve C
-        gmsh.model.geo.mesh.setTransfiniteCurve(
-            self.lines[2].tag, nb_points_wake, "Progression", progression_wake_inv)
-        gmsh.model.geo.mesh.setTransfiniteCurve(
-            self.lines[3].tag, nb_points_y, "Progression", progression_y_inv)
-        gmsh.model.geo.mesh.setTransfiniteCurve(
-            self.lines[10].tag, nb_points_wake, "Progression", progression_wake)  # same for plane D
-
-        # transfinite curve D
-        gmsh.model.geo.mesh.setTransfiniteCurve(
-            self.lines[9].tag, nb_points_y, "Progression", progression_y)  # same for plane E
-        gmsh.model.geo.mesh.setTransfiniteCurve(
-            self.lines[4].tag, nb_points_y, "Progression", progression_y)
-        gmsh.model.geo.mesh.setTransfiniteCurve(
-            self.lines[5].tag, nb_points_wake, "Progression", progression_wake)
-
-        # transfinite curve E
-        gmsh.model.geo.mesh.setTransfiniteCurve(
-            lower_spline_back.tag, nb_airfoil, "Progression", 1/ratio_airfoil)
+            progression_l1 = 1
         # For L6, we adapt depeding if the line is much longer than 1 or not (if goes "far in the front")
-        if pt7x < airfoil_spline.le.x-1.5:
-            gmsh.model.geo.mesh.setTransfiniteCurve(
-                self.lines[6].tag, nb_airfoil, "Progression", ratio_airfoil)
-        elif pt7x < airfoil_spline.le.x-0.4:
-            gmsh.model.geo.mesh.setTransfiniteCurve(
-                self.lines[6].tag, nb_airfoil, "Progression", math.sqrt(ratio_airfoil))
+        if pt7x < le.x-1.5:
+            progression_l6 = ratio_airfoil
+        elif pt7x < le.x-0.4:
+            progression_l6 = math.sqrt(ratio_airfoil)
         else:
-            gmsh.model.geo.mesh.setTransfiniteCurve(
-                self.lines[6].tag, nb_airfoil)
+            progression_l6 = 1
+
+        # (tag, number of nodes, type, coefficient) of each transfinite curve
+        transfinite_curves = [
+            # transfinite curve A
+            (lines[7].tag, nb_points_y, "Progression",
+             progression_y_inv),  # same for plane E
+            (spline_front, nb_airfoil_front, "Bump", bump_front),
+            (lines[0].tag, nb_points_y, "Progression",
+             progression_y),  # same for plane B
+            (self.circle_arc, nb_airfoil_front, "Bump", 1/coef),
+            # transfinite curve B
+            (lines[8].tag, nb_points_y, "Progression",
+             progression_y),  # same for plane C
+            (upper_spline_back.tag, nb_airfoil, "Progression", ratio_airfoil),
+            (lines[1].tag, nb_airfoil, "Progression", progression_l1),
+            # transfinite curve C
+            (lines[2].tag, nb_points_wake, "Progression", progression_wake_inv),
+            (lines[3].tag, nb_points_y, "Progression", progression_y_inv),
+            (lines[10].tag, nb_points_wake, "Progression",
+             progression_wake),  # same for plane D
+            # transfinite curve D
+            (lines[9].tag, nb_points_y, "Progression",
+             progression_y),  # same for plane E
+            (lines[4].tag, nb_points_y, "Progression", progression_y),
+            (lines[5].tag, nb_points_wake, "Progression", progression_wake),
+            # transfinite curve E
+            (lower_spline_back.tag, nb_airfoil, "Progression", 1/ratio_airfoil),
+            (lines[6].tag, nb_airfoil, "Progression", progression_l6),
+        ]
+        set_transfinite_curve = _geo.mesh.setTransfiniteCurve
+        for tag, nb_points, mesh_type, mesh_coef in transfinite_curves:
+            set_transfinite_curve(tag, nb_points, mesh_type, mesh_coef)
 
         # Now we add the surfaces
 
-        # transfinite surface A (forces structured mesh)
-        c1 = gmsh.model.geo.addCurveLoop(
-            [self.lines[7].tag, spline_front, self.lines[0].tag, - self.circle_arc])
-        surf1 = gmsh.model.geo.addPlaneSurface([c1])
-        gmsh.model.geo.mesh.setTransfiniteSurface(surf1)
-
-        # transfinite surface B
-        c2 = gmsh.model.geo.addCurveLoop(
-            [self.lines[0].tag, self.lines[1].tag, - self.lines[8].tag, - upper_spline_back.tag])
-        surf2 = gmsh.model.geo.addPlaneSurface([c2])
-        gmsh.model.geo.mesh.setTransfiniteSurface(surf2)
-
-        # transfinite surface C
-        c3 = gmsh.model.geo.addCurveLoop(
-            [self.lines[8].tag, self.lines[2].tag, self.lines[3].tag, self.lines[10].tag])
-        surf3 = gmsh.model.geo.addPlaneSurface([c3])
-        gmsh.model.geo.mesh.setTransfiniteSurface(surf3)
-
-        # transfinite surface D
-        c4 = gmsh.model.geo.addCurveLoop(
-            [- self.lines[9].tag, - self.lines[10].tag, self.lines[4].tag, self.lines[5].tag])
-        surf4 = gmsh.model.geo.addPlaneSurface([c4])
-        gmsh.model.geo.mesh.setTransfiniteSurface(surf4)
-
-        # transfinite surface E
-        c5 = gmsh.model.geo.addCurveLoop(
-            [self.lines[7].tag, - lower_spline_back.tag, self.lines[9].tag, self.lines[6].tag])
-        surf5 = gmsh.model.geo.addPlaneSurface([c5])
-        gmsh.model.geo.mesh.setTransfiniteSurface(surf5)
-        self.curveloops = [c1, c2, c3, c4, c5]
-        self.surfaces = [surf1, surf2, surf3, surf4, surf5]
-
-        # Lastly, recombine surface to create quadrilateral elements
-        gmsh.model.geo.mesh.setRecombine(2, surf1, 90)
-        gmsh.model.geo.mesh.setRecombine(2, surf2, 90)
-        gmsh.model.geo.mesh.setRecombine(2, surf3, 90)
-        gmsh.model.geo.mesh.setRecombine(2, surf4, 90)
-        gmsh.model.geo.mesh.setRecombine(2, surf5, 90)
+        # Curves bounding each transfinite surface (transfinite forces structured mesh)
+        surface_curves = (
+            # transfinite surface A
+            (lines[7].tag, spline_front, lines[0].tag, - self.circle_arc),
+            # transfinite surface B
+            (lines[0].tag, lines[1].tag, - lines[8].tag, - upper_spline_back.tag),
+            # transfinite surface C
+            (lines[8].tag, lines[2].tag, lines[3].tag, lines[10].tag),
+            # transfinite surface D
+            (- lines[9].tag, - lines[10].tag, lines[4].tag, lines[5].tag),
+            # transfinite surface E
+            (lines[7].tag, - lower_spline_back.tag, lines[9].tag, lines[6].tag),
+        )
+        add_curve_loop = _geo.addCurveLoop
+        add_plane_surface = _geo.addPlaneSurface
+        set_transfinite_surface = _geo.mesh.setTransfiniteSurface
+        set_recombine = _geo.mesh.setRecombine
+        self.curveloops, self.surfaces = [], []
+        for curves in surface_curves:
+            curveloop = add_curve_loop(curves)
+            surface = add_plane_surface((curveloop,))
+            set_transfinite_surface(surface)
+            # Recombine the surface to create quadrilateral elements
+            set_recombine(2, surface, 90)
+            self.curveloops.append(curveloop)
+            self.surfaces.append(surface)
 
     def define_bc(self):
         """
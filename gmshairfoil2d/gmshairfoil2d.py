@@ -3,15 +3,14 @@
 
 import argparse
 import math
+import multiprocessing
+import os
 import sys
 from pathlib import Path
 import numpy as np
 
-import gmsh
 from gmshairfoil2d.airfoil_func import (NACA_4_digit_geom, get_airfoil_points,
                                         get_all_available_airfoil_names)
-from gmshairfoil2d.geometry_def import (AirfoilSpline, Circle, PlaneSurface,
-                                        Rectangle, outofbounds, CType)
 
 
 def main():
@@ -34,16 +33,16 @@ def main():
         "--naca",
         type=str,
         metavar="4DIGITS",
-        nargs="?",
-        help="NACA airfoil 4 digit",
+        nargs="*",
+        help="NACA airfoil 4 digit (several airfoils are meshed in parallel)",
     )
 
     parser.add_argument(
         "--airfoil",
         type=str,
         metavar="NAME",
-        nargs="?",
-        help="Name of an airfoil profile in the database (database available with the --list argument)",
+        nargs="*",
+        help="Name of an airfoil profile in the database (database available with the --list argument) (several airfoils are meshed in parallel)",
     )
 
     parser.add_argument(
@@ -128,6 +127,12 @@ def main():
         help="Format of the mesh file, e.g: msh, vtk, wrl, stl, mesh, cgns, su2, dat (default su2)",
     )
 
+    parser.add_argument(
+        "--ascii",
+        action="store_true",
+        help="Write msh, vtk and cgns files in ASCII instead of binary (su2 and dat are always ASCII)",
+    )
+
     parser.add_argument(
         "--structural",
         action="store_true",
@@ -155,6 +160,20 @@ def main():
         action="store_true",
         help="Open GMSH user interface to see the mesh",
     )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print all the GMSH information messages (default: only errors and warnings)",
+    )
+
+    parser.add_argument(
+        "--threads",
+        type=int,
+        metavar="INT",
+        default=os.cpu_count() or 1,
+        help="Number of threads used by GMSH, shared between the airfoils meshed in parallel (default: number of cpus)",
+    )
     args = parser.parse_args()
 
     if len(sys.argv) == 1:
@@ -165,67 +184,187 @@ def main():
         get_all_available_airfoil_names()
         sys.exit()
 
-    # Airfoil choice
-    cloud_points = None
-    if args.naca:
-        airfoil_name = args.naca
-        cloud_points = NACA_4_digit_geom(airfoil_name)
+    if args.threads < 1:
+        parser.error("--threads must be at least 1")
 
-    if args.airfoil:
-        airfoil_name = args.airfoil
-        cloud_points = get_airfoil_points(airfoil_name)
+    # Airfoil choice (a name given twice would write twice the same mesh file, so only the first is kept)
+    airfoils = {}
+    for airfoil_name in args.naca or []:
+        if airfoil_name not in airfoils:
+            airfoils[airfoil_name] = NACA_4_digit_geom(airfoil_name)
 
-    if cloud_points is None:
+    for airfoil_name in args.airfoil or []:
+        if airfoil_name not in airfoils:
+            airfoils[airfoil_name] = get_airfoil_points(airfoil_name)
+
+    if not airfoils:
         print("\nNo airfoil profile specified, exiting")
         print("You must use --naca or --airfoil\n")
         parser.print_help()
         sys.exit()
 
+    # Each airfoil has its own gmsh session, so several airfoils are meshed in separate processes
+    # (gmsh holds the GIL during its calls). The user interface needs to stay in the main process.
+    # The number of processes is limited by --threads, so the total number of threads never exceeds it
+    nb_processes = min(len(airfoils), args.threads)
+    if nb_processes == 1 or args.ui:
+        mesh_paths = [_build_mesh_job((airfoil_name, cloud_points, args))
+                      for airfoil_name, cloud_points in airfoils.items()]
+    else:
+        # Share the threads between the processes instead of oversubscribing the cpus
+        args.threads //= nb_processes
+        jobs = [(airfoil_name, cloud_points, args)
+                for airfoil_name, cloud_points in airfoils.items()]
+        with multiprocessing.Pool(nb_processes) as pool:
+            mesh_paths = pool.map(_build_mesh_job, jobs)
+
+    # Some airfoils were skipped
+    if None in mesh_paths:
+        sys.exit(1)
+
+
+def _build_mesh_job(job):
+    """
+    Function that runs build_mesh for one airfoil, in the main process or in a worker
+
+    An airfoil going out of the domain is skipped (the reason is printed) instead
+    of stopping the whole run. Its gmsh session is closed so the next airfoil can
+    be meshed.
+    ...
+
+    Parameters
+    ----------
+    job : tuple
+        arguments of build_mesh (airfoil_name, cloud_points, args)
+
+    Returns
+    -------
+    _ : Path
+        path of the mesh file written, None if the airfoil was skipped
+    """
+    import gmsh
+    from gmshairfoil2d.geometry_def import OutOfBoundsError
+
+    try:
+        return build_mesh(*job)
+    except OutOfBoundsError as error:
+        print(f"\nSkipping airfoil {job[0]}:\n{error}\n")
+        gmsh.finalize()
+        return None
+
+
+def _start_at_leading_edge(cloud_points):
+    """
+    Function that reorders the airfoil points to start at the leading edge (last point
+    with the minimum x) and to go on with the upper side
+    ...
+
+    Parameters
+    ----------
+    cloud_points : array_like
+        array of shape (N, 3) with the points of the airfoil contour
+
+    Returns
+    -------
+    _ : np.ndarray
+        array of shape (N, 3) with the reordered points
+    """
+    cloud_points = np.asarray(cloud_points, dtype=np.float64)
+    xs = cloud_points[:, 0]
+    # last point with the minimum x
+    debut = len(xs) - 1 - int(xs[::-1].argmin())
+    cloud_points = np.roll(cloud_points, -debut, axis=0)
+    if cloud_points[1, 1] < cloud_points[0, 1]:
+        # reverse the order, keeping the leading edge first
+        cloud_points = np.roll(cloud_points[::-1], 1, axis=0)
+    return cloud_points
+
+
+def _bl_thickness(first_layer, ratio, nb_layers):
+    """
+    Function that computes the total height of the boundary layer, i.e. the sum of
+    the geometric series of the layers heights
+    ...
+
+    Parameters
+    ----------
+    first_layer : float
+        height of the first layer
+    ratio : float
+        growth ratio of the layers
+    nb_layers : int
+        number of layers
+
+    Returns
+    -------
+    _ : float
+        total height of the boundary layer
+    """
+    if ratio == 1:
+        return first_layer * nb_layers
+    return first_layer * (ratio**nb_layers - 1) / (ratio - 1)
+
+
+def build_mesh(airfoil_name, cloud_points, args):
+    """
+    Function that generates and writes the mesh around one airfoil
+    ...
+
+    Parameters
+    ----------
+    airfoil_name : str
+        name of the airfoil, used in the mesh file name
+    cloud_points : np.ndarray
+        array of shape (N, 3) with the points of the airfoil contour
+    args : argparse.Namespace
+        the arguments received by the parser
+
+    Returns
+    -------
+    _ : Path
+        path of the mesh file written
+    """
+    # gmsh (and its shared library) is only loaded when a mesh is built, not for --list or --help
+    import gmsh
+    from gmshairfoil2d.geometry_def import (AirfoilSpline, Circle, PlaneSurface,
+                                            Rectangle, outofbounds, CType)
+
     # Make the points all start by the (0,0) (or minimum of coord x when not exactly 0) and go clockwise
     # --> to be easier to deal with after (in airfoilspline)
-    le = min(p[0] for p in cloud_points)
-    for p in cloud_points:
-        if p[0] == le:
-            debut = cloud_points.index(p)
-    cloud_points = cloud_points[debut:]+cloud_points[:debut]
-    if cloud_points[1][1] < cloud_points[0][1]:
-        cloud_points.reverse()
-        cloud_points = cloud_points[-1:] + cloud_points[:-1]
+    cloud_points = _start_at_leading_edge(cloud_points)
 
     # Angle of attack
     aoa = -args.aoa * (math.pi / 180)
 
     # Generate Geometry
     gmsh.initialize()
+    # Only errors and warnings, unless asked otherwise
+    gmsh.option.setNumber("General.Verbosity", 5 if args.verbose else 2)
 
     # Airfoil
     airfoil = AirfoilSpline(
         cloud_points, args.airfoil_mesh_size)
     airfoil.rotation(aoa, (0.5, 0, 0), (0, 0, 1))
-    gmsh.model.geo.synchronize()
 
     # If structural, all is done in CType
     if args.structural:
         dx_wake, dy = [float(value)for value in args.arg_struc.split("x")]
         mesh = CType(airfoil, dx_wake, dy,
                      args.airfoil_mesh_size, args.first_layer, args.ratio, aoa)
-        mesh.define_bc()
+        # objects carrying the boundary conditions
+        bc_objects = [mesh]
 
     else:
         k1, k2 = airfoil.gen_skin()
         # Choose the parameters for bl (when exist)
         if not args.no_bl:
-            N = args.nb_layers
             r = args.ratio
-            d = [args.first_layer]
-            # Construct the vector of cumulative distance of each layer from airfoil
-            for i in range(1, N):
-                d.append(d[-1] - (-d[0]) * r**i)
+            total = _bl_thickness(args.first_layer, r, args.nb_layers)
         else:
-            d = [0]
+            total = 0
 
-        # Need to check that the layers or airfoil do not go outside the box/circle (d[-1] is the total height of bl)
-        outofbounds(airfoil, args.box, args.farfield, d[-1])
+        # Need to check that the layers or airfoil do not go outside the box/circle
+        outofbounds(airfoil, args.box, args.farfield, total)
 
         # External domain
         if args.box:
@@ -235,11 +374,9 @@ def main():
         else:
             ext_domain = Circle(0.5, 0, 0, radius=args.farfield,
                                 mesh_size=args.ext_mesh_size)
-        gmsh.model.geo.synchronize()
 
         # Create the surface for the mesh
         surface = PlaneSurface([ext_domain, airfoil])
-        gmsh.model.geo.synchronize()
 
         # Create the boundary layer
         if not args.no_bl:
@@ -251,10 +388,10 @@ def main():
 
             # Add the curves where we apply the boundary layer (around the airfoil for us)
             gmsh.model.mesh.field.setNumbers(f, 'CurvesList', curv)
-            gmsh.model.mesh.field.setNumber(f, 'Size', d[0])  # size 1st layer
+            gmsh.model.mesh.field.setNumber(f, 'Size', args.first_layer)  # size 1st layer
             gmsh.model.mesh.field.setNumber(f, 'Ratio', r)  # Growth ratio
             # Total thickness of boundary layer
-            gmsh.model.mesh.field.setNumber(f, 'Thickness', d[-1])
+            gmsh.model.mesh.field.setNumber(f, 'Thickness', total)
 
             # Forces to use quads and not triangle when =1 (i.e. true)
             gmsh.model.mesh.field.setNumber(f, 'Quads', 1)
@@ -265,23 +402,27 @@ def main():
 
             gmsh.model.mesh.field.setAsBoundaryLayer(f)
 
-        # Define boundary conditions (name the curves)
-        ext_domain.define_bc()
-        surface.define_bc()
-        airfoil.define_bc()
+        # objects carrying the boundary conditions
+        bc_objects = [ext_domain, surface, airfoil]
 
+    # Single synchronization of the whole geometry, needed before defining the physical groups
     gmsh.model.geo.synchronize()
 
+    # Define boundary conditions (name the curves)
+    for bc_object in bc_objects:
+        bc_object.define_bc()
+
     # Choose the parameters of the mesh : we want the mesh size according to the points and not curvature (doesn't work with farfield)
     gmsh.option.setNumber("Mesh.MeshSizeFromPoints", 1)
     gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", 0)
+    # Number of threads for the meshing (the surfaces are meshed in parallel)
+    gmsh.option.setNumber("General.NumThreads", args.threads)
     if not args.structural and not args.no_bl:
         # Add transfinite line on the front to get more point in the middle (where the curvature of the le makes it usually more spaced)
         x, y, v, w = airfoil.points[k1].x, airfoil.points[k2].y, airfoil.points[k1].x, airfoil.points[k2].y
         c1, c2 = airfoil.le.x, airfoil.le.y
         # To get an indication of numbers of points needed, compute approximate length of curve of front spline
-        l = (math.sqrt((x-c1)*(x-c1)+(y-c2)*(y-c2)) +
-             math.sqrt((v-c1)*(v-c1)+(w-c2)*(w-c2)))
+        l = math.hypot(x-c1, y-c2) + math.hypot(v-c1, w-c2)
         # As points will be more near than mesh size on the front, need more points
         nb_points = int(3.5*l/args.airfoil_mesh_size)
         gmsh.model.mesh.setTransfiniteCurve(
@@ -293,7 +434,9 @@ def main():
 
     # Generate mesh
     gmsh.model.mesh.generate(2)
-    gmsh.model.mesh.optimize("Laplace2D", 5)
+    # The structural mesh is fully defined by the transfinite curves, no need to smooth it
+    if not args.structural:
+        gmsh.model.mesh.optimize("Laplace2D", 5)
 
     # Open user interface of GMSH
     if args.ui:
@@ -302,8 +445,12 @@ def main():
     # Mesh file name and output
     mesh_path = Path(
         args.output, f"mesh_airfoil_{airfoil_name}.{args.format}")
+    # Binary output is smaller and faster to write, for the formats supporting it
+    if args.format in ("msh", "vtk", "cgns") and not args.ascii:
+        gmsh.option.setNumber("Mesh.Binary", 1)
     gmsh.write(str(mesh_path))
     gmsh.finalize()
+    return mesh_path
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@ import pickle
 from pathlib import Path
 
 import gmshairfoil2d.__init__
+import gmshairfoil2d.airfoil_func
 from gmshairfoil2d.airfoil_func import (NACA_4_digit_geom, get_airfoil_file,
                                         get_all_available_airfoil_names)
 from pytest import approx
@@ -54,6 +55,39 @@ def test_get_airfoil_file():
         assert profil_test == profil_dl
 
 
+def test_get_airfoil_file_cached(tmp_path, monkeypatch):
+    """
+    Test if an airfoil already in the database folder is not downloaded again,
+    unless the file is empty
+
+    """
+
+    class Response:
+        status_code = 200
+        content = b"downloaded"
+
+    requested = []
+
+    def get(url):
+        requested.append(url)
+        return Response()
+
+    monkeypatch.setattr(gmshairfoil2d.airfoil_func, "database_dir", tmp_path)
+    monkeypatch.setattr(gmshairfoil2d.airfoil_func.requests, "get", get)
+
+    # Non-empty file: no request
+    Path(tmp_path, "cached.dat").write_text("cached")
+    get_airfoil_file("cached")
+    assert not requested
+    assert Path(tmp_path, "cached.dat").read_text() == "cached"
+
+    # Empty file (interrupted download): downloaded again
+    Path(tmp_path, "empty.dat").touch()
+    get_airfoil_file("empty")
+    assert len(requested) == 1
+    assert Path(tmp_path, "empty.dat").read_bytes() == b"downloaded"
+
+
 def test_NACA_4_digit_geom():
     """
     Test if the NACA0012 profil and NACA4412 profil are correctly generated
@@ -2,7 +2,13 @@ from pathlib import Path
 
 import gmsh
 import gmshairfoil2d.__init__
-from gmshairfoil2d.geometry_def import Circle, PlaneSurface, Rectangle
+import gmshairfoil2d.airfoil_func
+import numpy as np
+from gmshairfoil2d.airfoil_func import NACA_4_digit_geom, get_airfoil_points
+from gmshairfoil2d.geometry_def import (_TE_CLAMPED, _TE_INTERSECTION, _TE_NOTHING,
+                                        AirfoilSpline, Circle, PlaneSurface, Rectangle,
+                                        _classify_te, _front_bounds, _te_point)
+from pytest import approx
 
 LIB_DIR = Path(gmshairfoil2d.__init__.__file__).parents[1]
 test_data_dir = Path(LIB_DIR, "tests", "test_data")
@@ -38,4 +44,144 @@ def test_mesh_rectangle():
     assert mesh_test == mesh_origin
 
 
-test_mesh_rectangle()
+def test_te_point():
+    """
+    Test the three outcomes of the computation of the pointy trailing edge
+
+    """
+
+    # The prolongations of the last segments meet just behind the trailing edge
+    q = np.array([[0.9, 0.015], [1.0, 0.005], [1.0, -0.005], [0.9, -0.015]])
+    new_x, new_y, status = _te_point(q, 1.0)
+    assert status == _TE_INTERSECTION
+    assert (new_x, new_y) == approx((1.05, 0.0))
+
+    # The prolongations meet right in front of the trailing edge : no point to add
+    q = np.array([[0.9995, 0.0], [1.0, 0.01], [1.0, -0.01], [0.9995, 0.0]])
+    assert _te_point(q, 1.0)[2] == _TE_NOTHING
+
+    # The prolongations meet far in front of the trailing edge, or never (parallel edges)
+    for q in (
+        np.array([[0.9, 0.0], [1.0, 0.01], [1.0, -0.01], [0.9, 0.0]]),
+        np.array([[0.9, 0.01], [1.0, 0.01], [1.0, -0.01], [0.9, -0.01]]),
+    ):
+        new_x, new_y, status = _te_point(q, 1.0)
+        assert status == _TE_CLAMPED
+        assert (new_x, new_y) == approx((1.05, 0.0))
+
+
+def test_front_bounds(monkeypatch):
+    """
+    Test the limits of the front part and the trailing edge classification on a
+    NACA0012 (sharp trailing edge) and a NACA0010 from a .dat file (blunt trailing edge)
+
+    """
+
+    monkeypatch.setattr(gmshairfoil2d.airfoil_func, "database_dir", test_data_dir)
+    sharp = NACA_4_digit_geom("0012")
+    blunt = get_airfoil_points("naca0010")
+
+    for cloud_points, vertical in ((sharp, False), (blunt, True)):
+        # Start at the leading edge, as in build_mesh
+        xs = np.roll(cloud_points, -int(cloud_points[:, 0].argmin()), axis=0)[:, 0]
+
+        te_up, te_down, is_vertical = _classify_te(xs, int(xs.argmax()))
+        assert is_vertical == vertical
+        if vertical:
+            assert xs[te_up] == xs[te_down] == xs.max()
+
+        threshold = 0.049
+        k1, k2 = _front_bounds(xs, threshold)
+        # k1 is the first point behind the threshold, k2 the last one before coming back in front
+        assert xs[k1] > threshold and (xs[:k1] <= threshold).all()
+        assert xs[k2] > threshold and (xs[k2 + 1:] <= threshold).all()
+        assert (xs[k1:k2 + 1] > threshold).all()
+
+
+def _points_coords():
+    """
+    Synchronize the geometry and return the coordinates of all the gmsh points by tag
+
+    """
+
+    gmsh.model.geo.synchronize()
+    return {
+        tag: np.array(gmsh.model.getValue(0, tag, []))
+        for _, tag in gmsh.model.getEntities(0)
+    }
+
+
+def _rotated(coords, angle, origin):
+    """
+    Rotate a point around the axis z going through origin
+
+    """
+
+    x, y = coords[0] - origin[0], coords[1] - origin[1]
+    return np.array([
+        origin[0] + x * np.cos(angle) - y * np.sin(angle),
+        origin[1] + x * np.sin(angle) + y * np.cos(angle),
+        coords[2],
+    ])
+
+
+def test_transformations_shared_points():
+    """
+    Test if the points shared by several curves (ends of the arcs of a circle, ends
+    of the splines of an airfoil) are rotated/translated only once
+
+    """
+
+    angle, origin = 0.3, (0.5, 0, 0)
+
+    gmsh.initialize()
+    circle = Circle(0.5, 0, 0, radius=2, mesh_size=0.5)
+    before = _points_coords()
+    circle.rotation(angle, origin, (0, 0, 1))
+    circle.translation((1, 2, 0))
+    after = _points_coords()
+    gmsh.finalize()
+
+    for tag, coords in before.items():
+        expected = _rotated(coords, angle, origin) + (1, 2, 0)
+        assert after[tag] == approx(expected, abs=1e-12)
+
+    gmsh.initialize()
+    airfoil = AirfoilSpline(NACA_4_digit_geom("0012"), 0.05)
+    airfoil.gen_skin()
+    before = _points_coords()
+    airfoil.rotation(angle, origin, (0, 0, 1))
+    after = _points_coords()
+    gmsh.finalize()
+
+    for tag, coords in before.items():
+        assert after[tag] == approx(_rotated(coords, angle, origin), abs=1e-12)
+
+
+def test_trailing_edge_wrap_around(monkeypatch):
+    """
+    Test if a vertical trailing edge made of the last and the first points of the
+    list is found and gets its pointy trailing edge as any other
+
+    """
+
+    # The last point is the trailing edge, the first one is just under it
+    xs = np.array([0.99995, 0.5, 0, 0.5, 0.9, 1.0])
+    assert _classify_te(xs, 5) == (5, 0, True)
+    assert _classify_te(xs[::-1], 0) == (5, 0, True)
+
+    monkeypatch.setattr(gmshairfoil2d.airfoil_func, "database_dir", test_data_dir)
+    cloud_points = get_airfoil_points("naca0010")
+    te_up, te_down, _ = _classify_te(cloud_points[:, 0], int(cloud_points[:, 0].argmax()))
+
+    gmsh.initialize()
+    airfoil = AirfoilSpline(cloud_points, 0.05)
+    # Same airfoil, with the lower trailing edge point first and the upper one last
+    wrapped = AirfoilSpline(np.roll(cloud_points, -te_down, axis=0), 0.05)
+    gmsh.finalize()
+
+    n = len(cloud_points)
+    assert wrapped.te_indx == n
+    assert len(wrapped.coords) == n + 1
+    assert (wrapped.te.x, wrapped.te.y) == approx((airfoil.te.x, airfoil.te.y))
+    assert wrapped.te.x > cloud_points[:, 0].max()
@@ -0,0 +1,154 @@
+import sys
+from pathlib import Path
+
+import gmshairfoil2d.__init__
+import gmshairfoil2d.airfoil_func
+import gmshairfoil2d.gmshairfoil2d
+import numpy as np
+from gmshairfoil2d.airfoil_func import NACA_4_digit_geom, get_airfoil_points
+from gmshairfoil2d.gmshairfoil2d import _bl_thickness, _start_at_leading_edge, main
+from pytest import approx, raises
+
+LIB_DIR = Path(gmshairfoil2d.__init__.__file__).parents[1]
+test_data_dir = Path(LIB_DIR, "tests", "test_data")
+
+COARSE_MESH = ["--no_bl", "--airfoil_mesh_size", "0.05", "--ext_mesh_size", "1"]
+
+
+def test_several_airfoils(tmp_path, monkeypatch):
+    """
+    Test if several --naca and --airfoil profiles are all meshed (in parallel),
+    each one in its own mesh file
+
+    """
+
+    # Read the .dat profiles from the test data instead of downloading them
+    monkeypatch.setattr(gmshairfoil2d.airfoil_func, "database_dir", test_data_dir)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["gmshairfoil2d", "--naca", "0012", "4412", "--airfoil", "naca0010",
+         "--farfield", "5", "--output", str(tmp_path), *COARSE_MESH],
+    )
+    main()
+
+    mesh_files = sorted(path.name for path in tmp_path.iterdir())
+    assert mesh_files == [
+        "mesh_airfoil_0012.su2",
+        "mesh_airfoil_4412.su2",
+        "mesh_airfoil_naca0010.su2",
+    ]
+
+
+def test_single_thread_sequential(tmp_path, monkeypatch):
+    """
+    Test if several airfoils are meshed one after the other in the main process
+    when only one thread is allowed
+
+    """
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("no process pool expected with --threads 1")
+
+    monkeypatch.setattr(gmshairfoil2d.gmshairfoil2d.multiprocessing, "Pool", no_pool)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["gmshairfoil2d", "--naca", "0012", "4412", "--threads", "1",
+         "--farfield", "5", "--output", str(tmp_path), *COARSE_MESH],
+    )
+    main()
+
+    mesh_files = sorted(path.name for path in tmp_path.iterdir())
+    assert mesh_files == ["mesh_airfoil_0012.su2", "mesh_airfoil_4412.su2"]
+
+def test_duplicated_airfoil(tmp_path, monkeypatch):
+    """
+    Test if an airfoil given twice is meshed only once (two processes would write
+    the same mesh file at the same time)
+
+    """
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("no process pool expected for a single airfoil")
+
+    monkeypatch.setattr(gmshairfoil2d.gmshairfoil2d.multiprocessing, "Pool", no_pool)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["gmshairfoil2d", "--naca", "0012", "0012", "--threads", "2",
+         "--farfield", "5", "--output", str(tmp_path), *COARSE_MESH],
+    )
+    main()
+
+    assert [path.name for path in tmp_path.iterdir()] == ["mesh_airfoil_0012.su2"]
+
+def test_airfoil_out_of_domain_skipped(tmp_path, monkeypatch):
+    """
+    Test if an airfoil which does not fit in the domain is skipped without stopping
+    the run, in the sequential and in the parallel case, and if the run then fails
+
+    """
+
+    # The NACA0012 fits in the box, not the (thicker and cambered) NACA4412
+    for threads in ("1", "2"):
+        output = Path(tmp_path, threads)
+        output.mkdir()
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["gmshairfoil2d", "--naca", "4412", "0012", "--box", "2x0.16", "--threads", threads,
+             "--output", str(output), *COARSE_MESH],
+        )
+        with raises(SystemExit) as exit_info:
+            main()
+
+        assert exit_info.value.code == 1
+        assert [path.name for path in output.iterdir()] == ["mesh_airfoil_0012.su2"]
+
+
+def test_start_at_leading_edge(monkeypatch):
+    """
+    Test if the points are reordered as the previous list based loop did, i.e starting
+    at the last point with the minimum x and going on with the upper side
+
+    """
+
+    def reference(cloud_points):
+        le = min(p[0] for p in cloud_points)
+        for p in cloud_points:
+            if p[0] == le:
+                debut = cloud_points.index(p)
+        cloud_points = cloud_points[debut:]+cloud_points[:debut]
+        if cloud_points[1][1] < cloud_points[0][1]:
+            cloud_points.reverse()
+            cloud_points = cloud_points[-1:] + cloud_points[:-1]
+        return cloud_points
+
+    monkeypatch.setattr(gmshairfoil2d.airfoil_func, "database_dir", test_data_dir)
+    naca0012 = NACA_4_digit_geom("0012")
+    clouds = [
+        naca0012,
+        naca0012[::-1],
+        np.roll(naca0012, 40, axis=0),
+        get_airfoil_points("naca0010"),
+        get_airfoil_points("naca4412"),
+        # several points with the minimum x (the last one is the leading edge)
+        np.array([[0, 0.1, 0], [1, 0, 0], [0, -0.1, 0], [0, 0, 0]]),
+    ]
+
+    for cloud_points in clouds:
+        expected = reference([tuple(p) for p in cloud_points.tolist()])
+        assert _start_at_leading_edge(cloud_points).tolist() == [list(p) for p in expected]
+
+
+def test_bl_thickness():
+    """
+    Test if the total height of the boundary layer is the last cumulative distance
+    of the layers, as previously computed
+
+    """
+
+    for first_layer, ratio, nb_layers in ((3e-5, 1.2, 35), (1e-3, 1.1, 20), (0.01, 1, 10), (0.1, 0.9, 5)):
+        d = first_layer * np.cumsum(np.power(ratio, np.arange(nb_layers), dtype=np.float64))
+        assert _bl_thickness(first_layer, ratio, nb_layers) == approx(d[-1], rel=1e-12)